@@ -1,16 +1,27 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 setup(
     name="pySystemTest",
     version="1.0.0",
-    packages=find_packages(),
+    # flat modules under src/ (console script imports api_tester directly); listed
+    # statically instead of scanning the tree with find_packages()
+    py_modules=["api_tester", "reporting", "utils"],
     package_dir={"": "src"},
+    include_package_data=False,
     install_requires=[
         "requests>=2.28",
-        "PyYAML>=6.0",
+        "PyYAML>=6.0",  # wheels bundle libyaml; CSafeLoader is used when available
         "jsonpath-ng>=1.5.3",
         "Jinja2>=3.0"
     ],
+    extras_require={
+        # optional C-accelerated JSON encoding/decoding
+        "speedups": ["orjson>=3.9"],
+        # --http2: multiplexed connections through httpx
+        "http2": ["httpx[http2]>=0.26"],
+    },
+    # ship precompiled, optimized bytecode (-OO: no docstrings/asserts) to cut cold-start work
+    options={"build_py": {"compile": True, "optimize": 2}},
     entry_points={
         "console_scripts": [
             "pySystemTest=api_tester:main_cli",
@@ -1,5 +1,9 @@
 """Entry point for packaged version of pySystemTest"""
+from multiprocessing import freeze_support
+
 from api_tester import main_cli
 
 if __name__ == "__main__":
+    # frozen Windows builds: lets report-rendering worker processes start without re-running the CLI
+    freeze_support()
     main_cli()
\ No newline at end of file
@@ -7,36 +7,91 @@ api_tester.py
 - Prints summary report at end
 """
 
+from __future__ import annotations
+
 import argparse
 import sys
 import json
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional, TYPE_CHECKING
 import re
-from copy import deepcopy
 import time
 import traceback
 import csv
-import requests
+import functools
 import yaml
-from jsonpath_ng import parse as jsonpath_parse
 import os
 import glob
-import pathlib
+import ssl
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is an optional C-accelerated JSON codec; fall back to the stdlib when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# utils sits next to this module: imported as a sibling when run as a script or installed,
+# relative to the package when loaded as src.api_tester
+try:
+    from .utils import simple_path
+except ImportError:
+    from utils import simple_path
+
+# requests and jsonpath_ng are imported where they are used so that loading
+# scenarios (and test collection) does not pay for their import time
+if TYPE_CHECKING:
+    import requests
 
 
 STORAGE_NOTE = "Scenarios loaded from YAML file"
 
 # simple $key placeholder pattern (no braces, single level keys)
-_SIMPLE_PLACEHOLDER_RE = re.compile(r"\$([A-Za-z0-9_]+)")
+_SIMPLE_PLACEHOLDER_RE = re.compile(r"\$([A-Za-z0-9_]+)", re.ASCII)
+
+# same pattern for scanning raw (UTF-8) YAML bytes before they are parsed
+_SIMPLE_PLACEHOLDER_BYTES_RE = re.compile(rb"\$([A-Za-z0-9_]+)")
 
 # runtime-only substitution: $var -> value from runtime dict (preserve type when string is exact placeholder)
-_RUNTIME_PLACEHOLDER_RE = re.compile(r"\$([A-Za-z0-9_]+)")
+_RUNTIME_PLACEHOLDER_RE = re.compile(r"\$([A-Za-z0-9_]+)", re.ASCII)
+
+# placeholder pattern for response-derived values, one alternation so a string is scanned once:
+#   $resp[step].status / $resp[step].text      -> 'kind' group
+#   $resp[step].jsonpath($.data.id)            -> 'path' group
+_RESP_PLACEHOLDER_RE = re.compile(
+    r"\$resp\[(?P<ref>[^\]]+)\]\.(?:(?P<kind>status|text)|jsonpath\((?P<path>[^)]+)\))"
+)
+
+# bound methods of the patterns used per string during substitution (skips the attribute
+# lookup on every call in the recursive walks)
+_exact_fullmatch = _SIMPLE_PLACEHOLDER_RE.fullmatch  # whole-string "$key" keeps the value's type
+_resp_fullmatch = _RESP_PLACEHOLDER_RE.fullmatch
+_resp_sub = _RESP_PLACEHOLDER_RE.sub
+
+# set from --verbose; failed requests only get a formatted traceback in the report when on
+_VERBOSE = False
+
+# the most common response placeholders, resolved by a dict lookup without any regex work
+_LITERAL_PLACEHOLDERS = {"$resp[last].status": "status_code", "$resp[last].text": "text"}
+
+# status-only steps drain (rather than drop the connection of) bodies up to this size
+_STREAM_DRAIN_LIMIT = 1 << 20
 
-# placeholder patterns for response-derived values
-_RESP_STATUS_RE = re.compile(r"\$resp\[(?P<ref>[^\]]+)\]\.status")
-_RESP_TEXT_RE = re.compile(r"\$resp\[(?P<ref>[^\]]+)\]\.text")
-# jsonpath form: $resp[step].jsonpath($.data.id)
-_RESP_JSONPATH_RE = re.compile(r"\$resp\[(?P<ref>[^\]]+)\]\.jsonpath\((?P<path>[^)]+)\)")
+# upper bound on concurrent requests of a single 'parallel: true' scenario
+_MAX_PARALLEL_STEPS = 16
+
+# returned by _resolve_resp_placeholder when a placeholder cannot be resolved
+_UNRESOLVED = object()
+
+# libyaml-backed loader when PyYAML was built with it, pure-Python SafeLoader otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# jsonpath_ng.parse() builds a new PLY parser on every call; keep one around instead
+# (built on first use). PLY parsers keep their state on the instance, so concurrent
+# scenarios serialize on the lock.
+_JP_PARSER = None
+_JP_LOCK = threading.Lock()
 
 
 def load_config(path: Optional[str]) -> Dict[str, Any]:
@@ -44,8 +99,8 @@ def load_config(path: Optional[str]) -> Dict[str, Any]:
     if not path:
         return {}
     try:
-        with open(path, "rt", encoding="utf-8") as fh:
-            cfg = yaml.safe_load(fh) or {}
+        with open(path, "rb") as fh:
+            cfg = yaml.load(fh, Loader=_YAML_LOADER) or {}
         if not isinstance(cfg, dict):
             raise ValueError("config file must be a mapping of key -> value")
         return cfg
@@ -53,50 +108,81 @@ def load_config(path: Optional[str]) -> Dict[str, Any]:
         raise ValueError(f"Failed to load config '{path}': {e}")
 
 
+def _copy_on_write(obj: Any, fn) -> Any:
+    """
+    Apply fn to each value of a dict/list. A new container is built only if some value
+    changed (fn returned a different object); otherwise obj itself is returned.
+    """
+    out = None
+    items = obj.items() if isinstance(obj, dict) else enumerate(obj)
+    for k, v in items:
+        nv = fn(v)
+        if nv is not v:
+            if out is None:
+                out = dict(obj) if isinstance(obj, dict) else list(obj)
+            out[k] = nv
+    return obj if out is None else out
+
+
 def _substitute_in_obj(obj: Any, cfg: Dict[str, Any]) -> Any:
     """
     Recursively substitute $key placeholders in strings using cfg (flat key→value mapping).
     - If a string is exactly "$key" and cfg[key] is not a str, return the typed value.
     - Otherwise perform string replacement with str(value).
+    Containers are copied only along changed branches; untouched input is returned as is.
     """
-    if isinstance(obj, dict):
-        return {k: _substitute_in_obj(v, cfg) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_substitute_in_obj(v, cfg) for v in obj]
+    if not cfg:
+        return obj
+    if isinstance(obj, (dict, list)):
+        return _copy_on_write(obj, lambda v: _substitute_in_obj(v, cfg))
     if isinstance(obj, str):
-        matches = list(_SIMPLE_PLACEHOLDER_RE.finditer(obj))
-        if not matches:
+        # no '$' at all is the common case: skip the regex engine entirely
+        if "$" not in obj:
             return obj
         # single exact placeholder -> preserve type
-        if len(matches) == 1 and matches[0].start() == 0 and matches[0].end() == len(obj):
-            key = matches[0].group(1)
-            if cfg and key in cfg:
+        exact = _exact_fullmatch(obj)
+        if exact:
+            key = exact.group(1)
+            if key in cfg:
                 return cfg[key]
             return obj
         # otherwise replace each occurrence with str(value) (or leave if missing)
         def _repl(m):
             key = m.group(1)
-            if cfg and key in cfg:
+            if key in cfg:
                 return str(cfg[key])
             return m.group(0)
         return _SIMPLE_PLACEHOLDER_RE.sub(_repl, obj)
     return obj
 
 
+def _iter_strings(obj: Any):
+    """Yield every string leaf of a nested dict/list structure."""
+    if isinstance(obj, dict):
+        for v in obj.values():
+            yield from _iter_strings(v)
+    elif isinstance(obj, list):
+        for v in obj:
+            yield from _iter_strings(v)
+    elif isinstance(obj, str):
+        yield obj
+
+
+def _has_placeholders(obj: Any) -> bool:
+    """True when any string in obj contains a $key placeholder."""
+    return any("$" in s and _SIMPLE_PLACEHOLDER_RE.search(s) for s in _iter_strings(obj))
+
+
 def _substitute_with_runtime(obj: Any, runtime: Dict[str, Any]) -> Any:
     """Recursively substitute $var placeholders using runtime dict only."""
-    if isinstance(obj, dict):
-        return {k: _substitute_with_runtime(v, runtime) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_substitute_with_runtime(v, runtime) for v in obj]
+    if isinstance(obj, (dict, list)):
+        return _copy_on_write(obj, lambda v: _substitute_with_runtime(v, runtime))
     if isinstance(obj, str):
-        if not runtime:
-            return obj
-        matches = list(_RUNTIME_PLACEHOLDER_RE.finditer(obj))
-        if not matches:
+        if not runtime or "$" not in obj:
             return obj
-        if len(matches) == 1 and matches[0].start() == 0 and matches[0].end() == len(obj):
-            key = matches[0].group(1)
+        exact = _exact_fullmatch(obj)
+        if exact:
+            key = exact.group(1)
             if key in runtime:
                 return runtime[key]
             return obj
@@ -107,20 +193,227 @@ def _substitute_with_runtime(obj: Any, runtime: Dict[str, Any]) -> Any:
     return obj
 
 
+def _load_yaml_cached(path: str) -> Tuple[Any, List[str]]:
+    """
+    Parse a YAML file and return (document, placeholder keys referenced in its text).
+    Reuses a sibling '<path>.cache.json' written on a previous run; the cache stores the
+    YAML file's mtime/size and is ignored once they change.
+    Substitutions are applied by the caller, so the cache holds the raw parsed document.
+    """
+    st = os.stat(path)
+    stamp = [st.st_mtime_ns, st.st_size]
+    json_cache = path + ".cache.json"
+    try:
+        with open(json_cache, "rt", encoding="utf-8") as fh:
+            cached = json.load(fh)
+        if cached.get("stamp") == stamp and "placeholders" in cached:
+            return cached.get("data"), cached["placeholders"]
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    # raw bytes go straight to libyaml (a str would be re-encoded to UTF-8 by the C loader)
+    with open(path, "rb") as f:
+        raw = f.read()
+    # one regex pass over the source finds every $key the document can reference
+    placeholders = sorted({key.decode("ascii") for key in _SIMPLE_PLACEHOLDER_BYTES_RE.findall(raw)})
+    data = yaml.load(raw, Loader=_YAML_LOADER)
+
+    # only cache documents that survive a JSON round-trip unchanged (no dates, non-str keys, ...)
+    try:
+        payload = json.dumps({"stamp": stamp, "placeholders": placeholders, "data": data})
+        if json.loads(payload)["data"] != data:
+            return data, placeholders
+        fd, tmp = tempfile.mkstemp(prefix=".scenarios-", suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, "wt", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(tmp, json_cache)
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except (OSError, TypeError, ValueError):
+        # cache is best effort (read-only checkout, non-JSON types); fall back to the parsed YAML
+        pass
+    return data, placeholders
+
+
 def load_scenarios(path: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Load scenarios YAML and apply simple $key substitutions using config."""
-    with open(path, "rt", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    data, placeholders = _load_yaml_cached(path)
+    data = data or {}
     if not data or "scenarios" not in data:
         raise ValueError("Invalid scenarios file: missing 'scenarios' key")
-    if config:
+    # skip the tree walk when the file text references none of the config keys
+    if config and any(key in config for key in placeholders):
         data = _substitute_in_obj(data, config)
     return data
 
 
-def execute_api_call(step: Dict[str, Any], session: Optional[requests.Session] = None) -> requests.Response:
-    """Execute HTTP request described by step['action'] and return Response."""
+class _Http2Pool:
+    """
+    HTTP/2 counterpart of _ConnectionPool, used with --http2.
+    Holds the httpx transports (connection pools) shared by all scenarios, so steps against
+    one host share a multiplexed connection. httpx configures TLS and proxies per transport,
+    so one set of transports is kept per distinct (verify, cert, proxies) combination.
+    """
+
+    def __init__(self, pool_maxsize: int = 64):
+        try:
+            import httpx
+            import h2  # noqa: F401  (httpx needs it for http2=True)
+        except ImportError as e:
+            raise RuntimeError(f"--http2 requires httpx with HTTP/2 support (pip install pySystemTest[http2]): {e}")
+
+        self._httpx = httpx
+        self._limits = httpx.Limits(max_keepalive_connections=pool_maxsize)
+        self._transports: Dict[Any, Tuple[Any, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _transport(self, verify: Any, proxy: Optional[str] = None):
+        return self._httpx.HTTPTransport(http2=True, verify=verify, limits=self._limits, retries=2, proxy=proxy)
+
+    def client(self, verify: Any, cert: Any, proxies: Optional[Dict[str, str]], cookies: Any):
+        """New httpx client with the given cookie jar over the shared transports for this configuration."""
+        transport, mounts = self._transports_for(verify, cert, proxies)
+        return self._httpx.Client(transport=transport, mounts=mounts or None, cookies=cookies)
+
+    def _transports_for(self, verify: Any, cert: Any, proxies: Optional[Dict[str, str]]) -> Tuple[Any, Dict[str, Any]]:
+        """(transport, proxy mounts) for one TLS/proxy configuration, built on first use."""
+        key = (verify, cert, tuple(sorted((proxies or {}).items())))
+        with self._lock:
+            entry = self._transports.get(key)
+            if entry is None:
+                tls: Any = verify
+                if isinstance(verify, str) or cert is not None:
+                    cafile = verify if isinstance(verify, str) else os.environ.get("REQUESTS_CA_BUNDLE")
+                    tls = ssl.create_default_context(cafile=cafile)
+                    if verify is False:
+                        tls.check_hostname = False
+                        tls.verify_mode = ssl.CERT_NONE
+                    if cert is not None:
+                        if isinstance(cert, tuple):
+                            tls.load_cert_chain(*cert)
+                        else:
+                            tls.load_cert_chain(cert)
+                mounts = {f"{scheme}://": self._transport(tls, proxy=url) for scheme, url in (proxies or {}).items()}
+                entry = self._transports[key] = (self._transport(tls), mounts)
+            return entry
+
+    def session(self) -> "_Http2Session":
+        """A fresh session (own cookie jar) sending through the shared transports."""
+        return _Http2Session(self)
+
+    def close(self):
+        with self._lock:
+            for transport, mounts in self._transports.values():
+                transport.close()
+                for mounted in mounts.values():
+                    mounted.close()
+            self._transports.clear()
+
+
+class _Http2Session:
+    """
+    Minimal stand-in for requests.Session used with --http2, one per scenario.
+    Requests go through httpx clients built on the pool's transports; the clients of one
+    session share a single cookie jar, so cookies stay within the scenario like they do
+    with requests. Responses expose the attributes the runner uses (status_code, headers,
+    content, text).
+    """
+
+    def __init__(self, pool: _Http2Pool):
+        from http.cookiejar import CookieJar
+
+        self._pool = pool
+        self._cookies = CookieJar()
+        self._clients: Dict[Any, Any] = {}
+
+    def _client(self, verify: Any, cert: Any, proxies: Optional[Dict[str, str]]):
+        # a session serves one scenario; its parallel steps may race to build the same
+        # client, which only costs a duplicate wrapper around the same transports
+        key = (verify, cert, tuple(sorted((proxies or {}).items())))
+        client = self._clients.get(key)
+        if client is None:
+            client = self._clients[key] = self._pool.client(verify, cert, proxies, self._cookies)
+        return client
+
+    def request(self, method: str, url: str, verify: Any = True, cert: Any = None,
+                proxies: Optional[Dict[str, str]] = None, allow_redirects: bool = True,
+                stream: bool = False, **kwargs):
+        # stream is a requests hint for skipping the body; httpx reads it eagerly here
+        client = self._client(verify, cert, proxies)
+        return client.request(method, url, follow_redirects=allow_redirects, **kwargs)
+
+    def close(self):
+        # like requests.Session.close(): closes the (pool's) connections
+        self._pool.close()
+
+
+class _ConnectionPool:
+    """
+    Keep-alive connections shared by all scenarios of a run.
+    Each scenario gets its own Session from session(), so cookies and other per-session
+    state never leak between scenarios, while every Session sends through the same
+    HTTPAdapter (and therefore the same urllib3 connection pools).
+    """
+
+    def __init__(self, pool_maxsize: int = 64):
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # retry only failures to establish a connection: the request never reached the server,
+        # so nothing is re-sent twice. Reads, redirects and statuses are never retried, and
+        # 429/503 responses (even with Retry-After) are returned to the scenario as they are.
+        retries = Retry(
+            total=None, connect=2, read=0, status=0, redirect=0, other=0, backoff_factor=0.1,
+            respect_retry_after_header=False, raise_on_status=False,
+        )
+        self._adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_maxsize, max_retries=retries)
+
+    def session(self) -> requests.Session:
+        """A fresh Session (own cookie jar) sending through the shared adapter."""
+        import requests
+
+        session = requests.Session()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        return session
+
+    def close(self):
+        self._adapter.close()
+
+
+def build_connection_pool(pool_maxsize: int = 64, http2: bool = False):
+    """
+    Create the connection pool shared by all scenarios of a run; call session() on it once
+    per scenario. pool_maxsize is the number of keep-alive connections kept per host; size it
+    to the number of requests that can be in flight at once, extra connections are not reused.
+    http2=True pools httpx transports instead (requires httpx[http2]).
+    """
+    if http2:
+        return _Http2Pool(pool_maxsize)
+    return _ConnectionPool(pool_maxsize)
+
+
+def build_session(pool_maxsize: int = 64, http2: bool = False) -> requests.Session:
+    """
+    Create a Session with its own keep-alive connection pool (see build_connection_pool).
+    Closing the Session closes its connections.
+    """
+    return build_connection_pool(pool_maxsize, http2=http2).session()
+
+
+def _normalize_step(step: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+    """
+    Resolve step['action'] into (method, url, request kwargs).
+    The result is cached on step['_compiled_action'] together with the action dict it was
+    built from; a substituted step carries a different action dict and is normalized afresh.
+    """
     action = step.get("action", {})
+    cached = step.get("_compiled_action")
+    if cached is not None and cached[0] is action:
+        return cached[1]
+
     method = (action.get("method") or "GET").upper()
     url = action.get("url")
     if not url:
@@ -137,20 +430,6 @@ def execute_api_call(step: Dict[str, Any], session: Optional[requests.Session] =
     proxies = action.get("proxies", None)
     allow_redirects = action.get("allow_redirects", True)
 
-    s = session or requests.Session()
-    
-    # Add debugging for HTTPS requests
-    if url.startswith('https://'):
-        print(f"\nSSL Debug for request to {url}:")
-        print(f"Verify setting: {verify}")
-        if isinstance(verify, str):
-            print(f"Custom CA bundle: {verify}")
-            if not os.path.exists(verify):
-                print(f"Warning: CA bundle file not found: {verify}")
-        print(f"Current cert file: {os.environ.get('REQUESTS_CA_BUNDLE', 'not set')}")
-    
-    
-
     kwargs = {"headers": headers, "timeout": timeout, "allow_redirects": allow_redirects}
     if body is not None:
         kwargs["json"] = body
@@ -169,7 +448,33 @@ def execute_api_call(step: Dict[str, Any], session: Optional[requests.Session] =
         elif isinstance(auth, dict) and auth.get("type") == "basic":
             kwargs["auth"] = (auth.get("user"), auth.get("pass"))
 
+    normalized = (method, url, kwargs)
+    step["_compiled_action"] = (action, normalized)
+    return normalized
+
+
+def execute_api_call(step: Dict[str, Any], session: Optional[requests.Session] = None) -> requests.Response:
+    """Execute HTTP request described by step['action'] and return Response."""
+    import requests
+
+    method, url, kwargs = _normalize_step(step)
+    # runner marks steps whose body is never read; the caller closes the response unread
+    if step.get("_stream"):
+        kwargs = {**kwargs, "stream": True}
+
+    s = session or requests.Session()
     
+    # Add debugging for HTTPS requests
+    if url.startswith('https://'):
+        verify = kwargs["verify"]
+        print(f"\nSSL Debug for request to {url}:")
+        print(f"Verify setting: {verify}")
+        if isinstance(verify, str):
+            print(f"Custom CA bundle: {verify}")
+            if not os.path.exists(verify):
+                print(f"Warning: CA bundle file not found: {verify}")
+        print(f"Current cert file: {os.environ.get('REQUESTS_CA_BUNDLE', 'not set')}")
+
     try:
         resp = s.request(method, url, **kwargs)
         return resp
@@ -181,17 +486,75 @@ def execute_api_call(step: Dict[str, Any], session: Optional[requests.Session] =
         raise
 
 
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON document with orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_indent(obj: Any) -> str:
+    """Pretty-print obj as JSON (2-space indent) with orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles them
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _json_report_bytes(report: Dict[str, Any]) -> bytes:
+    """
+    UTF-8 encoded, 2-space indented JSON for the report file, produced by orjson in one
+    call when installed (non-str dict keys are stringified as json.dump does).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(report, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _json_snippet(obj: Any, limit: int, size_hint: int) -> str:
+    """
+    Pretty-printed JSON of obj cut to limit characters. For documents larger than the
+    limit (size_hint: length of the raw body) the encoder output is consumed only until
+    the limit is reached instead of formatting the whole document and slicing it.
+    """
+    if size_hint <= limit:
+        return _json_dumps_indent(obj)[:limit]
+    out: List[str] = []
+    n = 0
+    for chunk in json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(obj):
+        out.append(chunk)
+        n += len(chunk)
+        if n >= limit:
+            break
+    return "".join(out)[:limit]
+
+
 def _extract_json(response: requests.Response) -> Any:
     """Safely parse response JSON; return None if invalid."""
     try:
-        return response.json()
-    except ValueError:
+        return _json_loads(response.content)
+    except (TypeError, ValueError):
         return None
 
 
-def _match_expected(actual: Any, expected: Any) -> bool:
-    """Loose equality match; handles numbers, strings, booleans, lists and dicts."""
-    return actual == expected
+@functools.lru_cache(maxsize=1024)
+def _compiled_path(path: str):
+    """Parse a JSONPath once and reuse the compiled expression (invalid paths are not cached)."""
+    simple = simple_path(path)
+    if simple is not None:
+        return simple
+    global _JP_PARSER
+    with _JP_LOCK:
+        if _JP_PARSER is None:
+            from jsonpath_ng.parser import JsonPathParser
+            _JP_PARSER = JsonPathParser()
+        return _JP_PARSER.parse(path)
 
 
 def verify_response(response: requests.Response, step: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
@@ -209,14 +572,20 @@ def verify_response(response: requests.Response, step: Dict[str, Any]) -> Tuple[
         - not_equals: check if value is not equal to expected
     Returns (True, None) on success, (False, message) on failure.
     """
-    verification = step.get("verification", {})
+    verification = step.get("verification")
+    if not verification:
+        return True, None
     expected_status = verification.get("status_code")
     if expected_status is not None:
         if response.status_code != expected_status:
             return False, f"Status Code mismatch: expected {expected_status}, got {response.status_code}"
 
-    json_assertions: List[Dict[str, Any]] = verification.get("json_assertions") or []
+    json_assertions: Optional[List[Dict[str, Any]]] = verification.get("json_assertions")
     if json_assertions:
+        # HTML error pages can be large; don't decode + lex them only to fail the JSON parse
+        ct = response.headers.get("Content-Type", "")
+        if "html" in ct.lower():
+            return False, f"Response is {ct!r}, not JSON, but json_assertions were provided"
         body = _extract_json(response)
         if body is None:
             return False, "Response body is not valid JSON but json_assertions were provided"
@@ -227,54 +596,56 @@ def verify_response(response: requests.Response, step: Dict[str, Any]) -> Tuple[
                 return False, "Invalid assertion: missing 'path'"
 
             try:
-                expr = jsonpath_parse(path)
+                expr = _compiled_path(path)
             except Exception as e:
                 return False, f"Invalid JSONPath '{path}': {e}"
 
-            matches = [m.value for m in expr.find(body)]
+            # values are read from the found datums lazily so a passing check stops at
+            # the first hit; the full value list is only built for failure messages
+            found = expr.find(body)
 
             # exists check
             if "exists" in assertion:
                 want = bool(assertion.get("exists"))
-                if want and not matches:
+                if want and not found:
                     return False, f"JSON path '{path}' not found (expected to exist)"
-                if (not want) and matches:
-                    return False, f"JSON path '{path}' expected to be absent but found {matches!r}"
+                if (not want) and found:
+                    return False, f"JSON path '{path}' expected to be absent but found {[d.value for d in found]!r}"
                 continue
 
             # not_null check
             if assertion.get("not_null"):
-                if not matches:
+                if not found:
                     return False, f"JSON path '{path}' not found (not_null asserted)"
-                if any(m is None for m in matches):
-                    return False, f"JSON path '{path}' contains null value(s): {matches!r}"
+                if any(d.value is None for d in found):
+                    return False, f"JSON path '{path}' contains null value(s): {[d.value for d in found]!r}"
                 continue
 
             # New: contains_string check
             if "contains_string" in assertion:
                 substring = str(assertion["contains_string"])
-                if not matches:
+                if not found:
                     return False, f"JSON path '{path}' not found (contains_string asserted)"
-                if not any(isinstance(m, str) and substring in str(m) for m in matches):
-                    return False, f"JSON path '{path}' values do not contain substring '{substring}', values: {matches!r}"
+                if not any(isinstance(m, str) and substring in str(m) for m in (d.value for d in found)):
+                    return False, f"JSON path '{path}' values do not contain substring '{substring}', values: {[d.value for d in found]!r}"
                 continue
 
             # New: not_equals check
             if "not_equals" in assertion:
                 expected = assertion["not_equals"]
-                if not matches:
+                if not found:
                     return False, f"JSON path '{path}' not found (not_equals asserted)"
-                if any(_match_expected(m, expected) for m in matches):
+                if expected in (d.value for d in found):
                     return False, f"JSON path '{path}' should not equal {expected!r} but found matching value"
                 continue
 
             # contains check (for arrays or objects)
             if "contains" in assertion:
                 expected = assertion.get("contains")
-                if not matches:
+                if not found:
                     return False, f"JSON path '{path}' not found (contains asserted)"
                 ok = False
-                for m in matches:
+                for m in (d.value for d in found):
                     if isinstance(m, (list, tuple)):
                         if expected in m:
                             ok = True
@@ -284,26 +655,25 @@ def verify_response(response: requests.Response, step: Dict[str, Any]) -> Tuple[
                         if expected in m.values() or expected in m.keys():
                             ok = True
                             break
-                    else:
-                        if _match_expected(m, expected):
-                            ok = True
-                            break
+                    elif m == expected:
+                        ok = True
+                        break
                 if not ok:
-                    return False, f"JSON path '{path}' does not contain {expected!r}; values: {matches!r}"
+                    return False, f"JSON path '{path}' does not contain {expected!r}; values: {[d.value for d in found]!r}"
                 continue
 
             # expected_value (existing behaviour)
             if "expected_value" in assertion:
                 expected = assertion.get("expected_value")
-                if not matches:
+                if not found:
                     return False, f"JSON path '{path}' not found"
-                matched_any = any(_match_expected(mv, expected) for mv in matches)
-                if not matched_any:
-                    return False, f"JSON path '{path}' expected {expected!r} but got {matches!r}"
+                # 'in' compares in C (identity first, then ==) and stops at the first hit
+                if expected not in (d.value for d in found):
+                    return False, f"JSON path '{path}' expected {expected!r} but got {[d.value for d in found]!r}"
                 continue
 
             # default: require presence
-            if not matches:
+            if not found:
                 return False, f"JSON path '{path}' not found"
 
     return True, None
@@ -327,11 +697,11 @@ def _capture_from_response(resp: requests.Response, capture_spec: Dict[str, Any]
         header_name = capture_spec.get("path") or capture_spec.get("header")
         if not header_name:
             return False, (name, "capture header requires 'path' (header name)")
-        # case-insensitive
-        for k, v in resp.headers.items():
-            if k.lower() == header_name.lower():
-                return True, (name, v)
-        return False, (name, f"header '{header_name}' not found")
+        # response headers are a case-insensitive mapping
+        try:
+            return True, (name, resp.headers[header_name])
+        except KeyError:
+            return False, (name, f"header '{header_name}' not found")
     # default: json
     body = _extract_json(resp)
     if body is None:
@@ -340,7 +710,7 @@ def _capture_from_response(resp: requests.Response, capture_spec: Dict[str, Any]
     if not path:
         return False, (name, "capture json requires 'path' (JSONPath)")
     try:
-        expr = jsonpath_parse(path)
+        expr = _compiled_path(path)
     except Exception as e:
         return False, (name, f"invalid JSONPath '{path}': {e}")
     matches = [m.value for m in expr.find(body)]
@@ -363,7 +733,43 @@ def _resolve_resp_ref(ref: str, responses_by_name: dict, responses_by_index: dic
         return responses_by_name.get(ref)
 
 
-def _substitute_response_placeholders(obj, responses_by_name, responses_by_index, responses_list):
+def _resolve_resp_placeholder(
+    m: re.Match, responses_by_name: dict, responses_by_index: dict, responses_list: list, memo: Optional[dict] = None
+) -> Any:
+    """
+    Resolve one _RESP_PLACEHOLDER_RE match: status code, response text, or the list of
+    values matched by the jsonpath. Returns _UNRESOLVED when it cannot be resolved.
+    memo, when given, keeps resolved responses and parsed bodies per ref so several
+    placeholders referring to the same response look it up and parse it only once.
+    """
+    if memo is None:
+        memo = {}
+    ref = m.group("ref")
+    if ref not in memo:
+        memo[ref] = _resolve_resp_ref(ref, responses_by_name, responses_by_index, responses_list)
+    resp = memo[ref]
+    if not resp:
+        return _UNRESOLVED
+    kind = m.group("kind")
+    if kind == "status":
+        return resp.status_code
+    if kind == "text":
+        return resp.text
+    body_key = ("json", ref)
+    if body_key not in memo:
+        memo[body_key] = _extract_json(resp)
+    body = memo[body_key]
+    if body is None:
+        return _UNRESOLVED
+    try:
+        expr = _compiled_path(m.group("path"))
+    except Exception:
+        return _UNRESOLVED
+    matches = [d.value for d in expr.find(body)]
+    return matches or _UNRESOLVED
+
+
+def _substitute_response_placeholders(obj, responses_by_name, responses_by_index, responses_list, _memo=None):
     """
     Recursively substitute $resp[...] placeholders inside obj.
     Supports:
@@ -371,72 +777,44 @@ def _substitute_response_placeholders(obj, responses_by_name, responses_by_index
       - $resp[<...>].text                 -> full response text
       - $resp[<...>].jsonpath(<jsonpath>) -> first matching value (typed) or joins if many
     """
-    if isinstance(obj, dict):
-        return {k: _substitute_response_placeholders(v, responses_by_name, responses_by_index, responses_list) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_substitute_response_placeholders(v, responses_by_name, responses_by_index, responses_list) for v in obj]
+    if isinstance(obj, (dict, list)):
+        if _memo is None:
+            _memo = {}
+        return _copy_on_write(
+            obj,
+            lambda v: _substitute_response_placeholders(v, responses_by_name, responses_by_index, responses_list, _memo),
+        )
     if isinstance(obj, str):
+        if "$resp[" not in obj:
+            return obj
+        attr = _LITERAL_PLACEHOLDERS.get(obj)
+        if attr is not None:
+            resp = responses_list[-1] if responses_list else None
+            return getattr(resp, attr) if resp else obj
+        if _memo is None:
+            _memo = {}
         # full-string exact match for jsonpath/status/text -> preserve type when possible
-        m_j = _RESP_JSONPATH_RE.fullmatch(obj)
-        if m_j:
-            ref = m_j.group("ref")
-            path = m_j.group("path")
-            resp = _resolve_resp_ref(ref, responses_by_name, responses_by_index, responses_list)
-            if not resp:
-                return obj
-            body = _extract_json(resp)
-            if body is None:
-                return obj
-            try:
-                expr = jsonpath_parse(path)
-            except Exception:
+        m = _resp_fullmatch(obj)
+        if m:
+            value = _resolve_resp_placeholder(m, responses_by_name, responses_by_index, responses_list, _memo)
+            if value is _UNRESOLVED:
                 return obj
-            matches = [m.value for m in expr.find(body)]
-            if not matches:
-                return obj
-            # if single match return typed value
-            if len(matches) == 1:
-                return matches[0]
-            # otherwise return list
-            return matches
-
-        m_s = _RESP_STATUS_RE.fullmatch(obj)
-        if m_s:
-            ref = m_s.group("ref")
-            resp = _resolve_resp_ref(ref, responses_by_name, responses_by_index, responses_list)
-            return resp.status_code if resp else obj
-
-        m_t = _RESP_TEXT_RE.fullmatch(obj)
-        if m_t:
-            ref = m_t.group("ref")
-            resp = _resolve_resp_ref(ref, responses_by_name, responses_by_index, responses_list)
-            return resp.text if resp else obj
+            if m.group("path") is not None:
+                # single jsonpath match -> typed value, otherwise the list
+                return value[0] if len(value) == 1 else value
+            return value
 
         # otherwise do inline replacements (stringified)
-        def _repl_jsonpath(m):
-            ref = m.group("ref")
-            path = m.group("path")
-            resp = _resolve_resp_ref(ref, responses_by_name, responses_by_index, responses_list)
-            if not resp:
-                return m.group(0)
-            body = _extract_json(resp)
-            if body is None:
-                return m.group(0)
-            try:
-                expr = jsonpath_parse(path)
-            except Exception:
-                return m.group(0)
-            matches = [r.value for r in expr.find(body)]
-            if not matches:
-                return m.group(0)
-            # join multiple as comma-separated
-            return ",".join(str(x) for x in matches)
-
-        s = _RESP_JSONPATH_RE.sub(_repl_jsonpath, obj)
-        # replace status/text inline
-        s = _RESP_STATUS_RE.sub(lambda mo: str(_resolve_resp_ref(mo.group("ref"), responses_by_name, responses_by_index, responses_list).status_code) if _resolve_resp_ref(mo.group("ref"), responses_by_name, responses_by_index, responses_list) else mo.group(0), s)
-        s = _RESP_TEXT_RE.sub(lambda mo: (_resolve_resp_ref(mo.group("ref"), responses_by_name, responses_by_index, responses_list).text) if _resolve_resp_ref(mo.group("ref"), responses_by_name, responses_by_index, responses_list) else mo.group(0), s)
-        return s
+        def _repl(mo):
+            value = _resolve_resp_placeholder(mo, responses_by_name, responses_by_index, responses_list, _memo)
+            if value is _UNRESOLVED:
+                return mo.group(0)
+            if mo.group("path") is not None:
+                # join multiple as comma-separated
+                return ",".join(str(x) for x in value)
+            return str(value)
+
+        return _resp_sub(_repl, obj)
     return obj
 
 
@@ -467,137 +845,231 @@ def load_test_data(csv_path: Optional[str]) -> Dict[str, Dict[str, str]]:
     return test_data
 
 
-def run_scenario(scenario: Dict[str, Any], test_data: Optional[Dict[str, Dict[str, str]]] = None) -> Tuple[bool, Optional[Dict[str, Any]]]:
-    """Run scenario with optional test data substitution."""
+def _release_streamed(resp: requests.Response) -> None:
+    """
+    Return the connection of a passed status-only (stream=True) response to the pool.
+    resp.close() on an unread response closes the socket, so bodies declared up to
+    _STREAM_DRAIN_LIMIT bytes are drained first to keep the connection alive; larger or
+    unknown-length bodies are not downloaded and their connection is closed instead.
+    """
+    raw = getattr(resp, "raw", None)
+    length = resp.headers.get("Content-Length", "")
+    if hasattr(raw, "drain_conn") and length.isdigit() and int(length) <= _STREAM_DRAIN_LIMIT:
+        raw.drain_conn()
+        raw.release_conn()
+    else:
+        resp.close()
+
+
+def _prepare_step(step: Dict[str, Any], scenario_data: Dict[str, Any], responses_by_name: dict,
+                  responses_by_index: dict, responses_list: list) -> Dict[str, Any]:
+    """
+    Return step with test data values and then $resp[...] placeholders substituted.
+    Substitution is copy-on-write: a step without placeholders is returned unchanged
+    (not copied), so the scenario data itself is never modified.
+    """
+    if step.get("_has_placeholders") is False:
+        # stamped at load time: nothing to substitute
+        return step
+    step_to_run = step
+    if scenario_data and _has_placeholders(step_to_run):
+        step_to_run = _substitute_in_obj(step_to_run, scenario_data)
+    return _substitute_response_placeholders(step_to_run, responses_by_name, responses_by_index, responses_list)
+
+
+def _timed_call(step: Dict[str, Any], session: Optional[requests.Session]) -> Tuple[float, int, Any, Optional[Exception]]:
+    """Execute step and return (start, duration_ms, response or None, exception or None)."""
+    t0 = time.time()
+    try:
+        resp = execute_api_call(step, session=session)
+    except Exception as exc:
+        return t0, int((time.time() - t0) * 1000), None, exc
+    return t0, int((time.time() - t0) * 1000), resp, None
+
+
+def run_scenario(scenario: Dict[str, Any], test_data: Optional[Dict[str, Dict[str, str]]] = None,
+                 session: Optional[requests.Session] = None) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """Run scenario with optional test data substitution (reuses session when given)."""
     name = scenario.get("name", "<unnamed>")
     steps = scenario.get("steps", []) or []
     
+    # progress lines are collected and written once per scenario instead of per step
+    out: List[str] = []
+
     # Get test data for this scenario if available
     scenario_data = {}
     if test_data and name in test_data:
         scenario_data = test_data[name]
-        print(f"\n=== Running scenario: {name} ({len(steps)} step(s)) with test data ===")
+        out.append(f"\n=== Running scenario: {name} ({len(steps)} step(s)) with test data ===\n")
     else:
-        print(f"\n=== Running scenario: {name} ({len(steps)} step(s)) ===")
-    
-    session = requests.Session()
+        out.append(f"\n=== Running scenario: {name} ({len(steps)} step(s)) ===\n")
+
+    session = session or build_session()
+
+    # response bodies are only read back by json_assertions and $resp[...] placeholders
+    reads_responses = any("$resp[" in s for s in _iter_strings(steps))
 
     # response context storages
     responses_by_name = {}
     responses_by_index = {}
     responses_list = []
 
-    for idx, step in enumerate(steps, start=1):
-        step_name = step.get("name", f"step-{idx}")
-        print(f"  [{idx}/{len(steps)}] -> {step_name} ... ", end="", flush=True)
+    try:
+        for idx, step in enumerate(steps, start=1):
+            step_name = step.get("name", f"step-{idx}")
+            out.append(f"  [{idx}/{len(steps)}] -> {step_name} ... ")
 
-        # Create substituted copy of step
-        step_to_run = deepcopy(step)
-        
-        # First substitute test data values
-        if scenario_data:
-            step_to_run = _substitute_in_obj(step_to_run, scenario_data)
-            
-        # Then substitute response values (existing logic)
-        step_to_run = _substitute_response_placeholders(
-            step_to_run, responses_by_name, responses_by_index, responses_list
-        )
+            step_to_run = _prepare_step(step, scenario_data, responses_by_name, responses_by_index, responses_list)
+
+            # status-only step: don't download the body unless the step fails
+            status_only = not reads_responses and not (step_to_run.get("verification") or {}).get("json_assertions")
+            if status_only:
+                step_to_run = {**step_to_run, "_stream": True}
 
-        try:
-            resp = execute_api_call(step_to_run, session=session)
-        except Exception as e:
-            print("ERROR")
-            return False, {"step_index": idx, "step_name": step_name, "error": f"Request failed: {e}"}
-
-        # store response for later substitutions
-        responses_list.append(resp)
-        responses_by_index[idx] = resp
-        responses_by_name[step_name] = resp
-        responses_by_name["last"] = resp
-
-        ok, err = verify_response(resp, step_to_run)
-        if ok:
-            print("OK")
-            continue
-        else:
-            print("FAILED")
-            resp_info = {
-                "status_code": resp.status_code,
-                "body_snippet": None
-            }
             try:
-                resp_json = _extract_json(resp)
-                resp_info["body_snippet"] = json.dumps(resp_json, indent=2)[:1000]
-            except Exception:
-                resp_info["body_snippet"] = (resp.text or "")[:1000]
-            return False, {"step_index": idx, "step_name": step_name, "error": err, "response": resp_info}
-    return True, None
+                resp = execute_api_call(step_to_run, session=session)
+            except Exception as e:
+                out.append("ERROR\n")
+                return False, {"step_index": idx, "step_name": step_name, "error": f"Request failed: {e}"}
+
+            # store response for later substitutions
+            responses_list.append(resp)
+            responses_by_index[idx] = resp
+            responses_by_name[step_name] = resp
+            responses_by_name["last"] = resp
+
+            ok, err = verify_response(resp, step_to_run)
+            if ok:
+                out.append("OK\n")
+                if status_only:
+                    _release_streamed(resp)
+                continue
+            else:
+                out.append("FAILED\n")
+                # raw body text: no second JSON parse + re-serialize just for a snippet
+                resp_info = {
+                    "status_code": resp.status_code,
+                    "body_snippet": (resp.text or "")[:1000]
+                }
+                return False, {"step_index": idx, "step_name": step_name, "error": err, "response": resp_info}
+        return True, None
+    finally:
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
 
 
 def _gather_yaml_files_from_dir(dir_path: str) -> List[str]:
     """Return sorted list of .yml/.yaml files under dir_path (recursive)."""
-    p = pathlib.Path(dir_path)
-    if not p.is_dir():
+    if not os.path.isdir(dir_path):
         return []
-    # collect both .yml and .yaml
-    files = []
-    files.extend(sorted([str(x) for x in p.rglob("*.yml") if x.is_file()]))
-    files.extend(sorted([str(x) for x in p.rglob("*.yaml") if x.is_file()]))
-    # de-duplicate and keep deterministic order
-    seen = set()
+    # one walk collects both extensions; each path is seen once so no de-duplication is needed.
+    # Like the pathlib.rglob() calls this replaced, symlinked directories are followed and
+    # the extension matches in any case (*.YML, *.Yaml, ...)
     out = []
-    for f in files:
-        if f not in seen:
-            seen.add(f)
-            out.append(f)
+    for root, _dirs, names in os.walk(os.path.normpath(dir_path), followlinks=True):
+        for name in names:
+            if name.lower().endswith((".yml", ".yaml")):
+                f = os.path.join(root, name)
+                if os.path.isfile(f):
+                    out.append(f)
+    # deterministic order: all .yml files first, then .yaml, each sorted by path
+    out.sort(key=lambda f: (f.lower().endswith(".yaml"), f))
     return out
 
 
+def _compile_scenarios(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Do the per-step work that does not depend on responses once, before any request is sent:
+    - stamp each step with '_has_placeholders' so runners can skip substitution walks
+    - normalize actions that contain no placeholder into the '_compiled_action' request tuple
+      (see _normalize_step); substitution never replaces such an action, so every run
+      sends it as is. Actions that fail to normalize are reported when the step runs.
+    - warm the _compiled_path cache with every JSONPath of json_assertions, capture entries
+      and $resp[...].jsonpath(...) placeholders. Paths still containing a $key placeholder
+      are skipped: test data substitution changes them before they are used. The cache is
+      keyed by the final path string, so runners simply call _compiled_path again. Invalid
+      paths are left alone so they are reported when the step runs.
+    """
+    for scenario in data.get("scenarios", []) or []:
+        for step in scenario.get("steps", []) or []:
+            if not isinstance(step, dict):
+                continue
+            step["_has_placeholders"] = _has_placeholders(step)
+            if isinstance(step.get("action"), dict) and not _has_placeholders(step["action"]):
+                try:
+                    _normalize_step(step)
+                except Exception:
+                    pass
+            specs = list((step.get("verification") or {}).get("json_assertions") or [])
+            specs.extend(step.get("capture") or [])
+            for spec in specs:
+                path = spec.get("path") if isinstance(spec, dict) else None
+                if isinstance(path, str) and not _has_placeholders(path):
+                    try:
+                        _compiled_path(path)
+                    except Exception:
+                        pass
+            for text in _iter_strings(step):
+                if "$resp[" not in text:
+                    continue
+                for m in _RESP_PLACEHOLDER_RE.finditer(text):
+                    if m.group("path") is None:
+                        continue
+                    try:
+                        _compiled_path(m.group("path"))
+                    except Exception:
+                        pass
+    return data
+
+
+def _load_scenario_files(files: List[str], config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Load several scenario files and combine their 'scenarios' lists in the order of files.
+    """
+    combined = []
+    for f in files:
+        data = load_scenarios(f, config=config)
+        sc = data.get("scenarios", [])
+        for s in sc:
+            # annotate origin for debugging/reporting
+            s["_source_file"] = f
+        combined.extend(sc)
+    return {"scenarios": combined}
+
+
 def load_scenarios_aggregate(path: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Load scenarios from a single YAML file or from all YAML files under a directory.
     If directory, combines all 'scenarios' lists into one dict {'scenarios': [...]}
     and annotates each scenario with '_source_file'.
+    Steps are pre-processed once here (see _compile_scenarios).
     """
     if os.path.isdir(path):
         files = _gather_yaml_files_from_dir(path)
         if not files:
             raise ValueError(f"No scenario YAML files found in directory: {path}")
-        combined = []
-        for f in files:
-            data = load_scenarios(f, config=config)
-            sc = data.get("scenarios", [])
-            for s in sc:
-                # annotate origin for debugging/reporting
-                s["_source_file"] = f
-            combined.extend(sc)
-        return {"scenarios": combined}
+        return _compile_scenarios(_load_scenario_files(files, config))
     # if file, load single
     if os.path.isfile(path):
-        return load_scenarios(path, config=config)
+        return _compile_scenarios(load_scenarios(path, config=config))
     # try glob expansion
     hits = sorted(glob.glob(path, recursive=True))
     yaml_hits = [h for h in hits if os.path.isfile(h) and h.lower().endswith((".yml", ".yaml"))]
     if yaml_hits:
-        combined = []
-        for f in yaml_hits:
-            data = load_scenarios(f, config=config)
-            sc = data.get("scenarios", [])
-            for s in sc:
-                s["_source_file"] = f
-            combined.extend(sc)
-        return {"scenarios": combined}
+        return _compile_scenarios(_load_scenario_files(yaml_hits, config))
     raise ValueError(f"Provided scenarios path is not a file, directory, or matching glob: {path}")
 
 
-def run_scenario_collect(scenario: Dict[str, Any], test_data: Optional[Dict[str, Dict[str, str]]] = None) -> Tuple[bool, Optional[Dict[str, Any]], Dict[str, Any]]:
+def run_scenario_collect(scenario: Dict[str, Any], test_data: Optional[Dict[str, Dict[str, str]]] = None,
+                         session: Optional[requests.Session] = None) -> Tuple[bool, Optional[Dict[str, Any]], Dict[str, Any]]:
     """
     Run scenario and return (ok, info_on_failure_or_none, scenario_report).
     scenario_report contains per-step request/response/verification/timing data.
+    Pass a session from build_connection_pool().session() to reuse connections across scenarios.
     """
     name = scenario.get("name", "<unnamed>")
     steps = scenario.get("steps", []) or []
-    session = requests.Session()
+    session = session or build_session()
 
     # Get test data for this scenario if available
     scenario_data = {}
@@ -618,76 +1090,87 @@ def run_scenario_collect(scenario: Dict[str, Any], test_data: Optional[Dict[str,
     responses_by_index = {}
     responses_list = []
 
-    for idx, step in enumerate(steps, start=1):
-        step_name = step.get("name", f"step-{idx}")
-        step_record: Dict[str, Any] = {"index": idx, "name": step_name, "start": None, "duration_ms": None,
-                                       "request": None, "response": None, "verification": None, "error": None}
-        # prepare substituted step
-        step_to_run = deepcopy(step)
-        
-        # First substitute test data values if available
-        if scenario_data:
-            step_to_run = _substitute_in_obj(step_to_run, scenario_data)
-            
-        # Then substitute response values
-        step_to_run = _substitute_response_placeholders(step_to_run, responses_by_name, responses_by_index, responses_list)
-
-        # record request-ish info
-        action = step_to_run.get("action", {})
-        step_record["request"] = {
-            "method": (action.get("method") or "GET").upper(),
-            "url": action.get("url"),
-            "headers": action.get("headers"),
-            "params": action.get("params"),
-            "body": action.get("body"),
-            "timeout": action.get("timeout")
-        }
-
-        t0 = time.time()
-        step_record["start"] = t0
-        try:
-            resp = execute_api_call(step_to_run, session=session)
-        except Exception as exc:
-            step_record["duration_ms"] = int((time.time() - t0) * 1000)
-            step_record["error"] = f"Request failed: {exc}\n{traceback.format_exc()}"
-            report["steps"].append(step_record)
-            # return failure info in the same format run_scenario uses
-            return False, {"step_index": idx, "step_name": step_name, "error": str(exc)}, report
+    # parallel: true -> steps don't depend on each other; send every request up front over
+    # the shared session and verify the responses in step order
+    prepared: Dict[int, Dict[str, Any]] = {}
+    pending: Dict[int, Any] = {}
+    pool = None
+    if scenario.get("parallel") and len(steps) > 1 and not any("$resp[" in s for s in _iter_strings(steps)):
+        prepared = {idx: _prepare_step(step, scenario_data, {}, {}, []) for idx, step in enumerate(steps, start=1)}
+        pool = ThreadPoolExecutor(max_workers=min(len(steps), _MAX_PARALLEL_STEPS))
+        pending = {idx: pool.submit(_timed_call, st, session) for idx, st in prepared.items()}
+
+    try:
+        for idx, step in enumerate(steps, start=1):
+            step_name = step.get("name", f"step-{idx}")
+            step_record: Dict[str, Any] = {"index": idx, "name": step_name, "start": None, "duration_ms": None,
+                                           "request": None, "response": None, "verification": None, "error": None}
+            # prepare substituted step
+            step_to_run = prepared.get(idx) or _prepare_step(step, scenario_data, responses_by_name,
+                                                             responses_by_index, responses_list)
+
+            # record request-ish info
+            action = step_to_run.get("action", {})
+            step_record["request"] = {
+                "method": (action.get("method") or "GET").upper(),
+                "url": action.get("url"),
+                "headers": action.get("headers"),
+                "params": action.get("params"),
+                "body": action.get("body"),
+                "timeout": action.get("timeout")
+            }
 
-        duration_ms = int((time.time() - t0) * 1000)
-        step_record["duration_ms"] = duration_ms
+            if idx in pending:
+                t0, duration_ms, resp, exc = pending[idx].result()
+            else:
+                t0, duration_ms, resp, exc = _timed_call(step_to_run, session)
+            step_record["start"] = t0
+            step_record["duration_ms"] = duration_ms
+            if exc is not None:
+                if _VERBOSE:
+                    tb = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+                    step_record["error"] = f"Request failed: {exc}\n{tb}"
+                else:
+                    step_record["error"] = f"Request failed: {exc}"
+                report["steps"].append(step_record)
+                # return failure info in the same format run_scenario uses
+                return False, {"step_index": idx, "step_name": step_name, "error": str(exc)}, report
+
+            # store response context
+            responses_list.append(resp)
+            responses_by_index[idx] = resp
+            responses_by_name[step_name] = resp
+            responses_by_name["last"] = resp
+
+            # response snapshot (headers + status + body snippet / json typed if possible)
+            resp_record: Dict[str, Any] = {"status_code": resp.status_code, "headers": dict(resp.headers)}
+            try:
+                body_json = _extract_json(resp)
+                resp_record["json"] = body_json
+                # keep a text snippet too
+                resp_record["text_snippet"] = _json_snippet(body_json, 2000, len(resp.content)) if body_json is not None else (resp.text or "")[:2000]
+            except Exception:
+                resp_record["text_snippet"] = (resp.text or "")[:2000]
+            step_record["response"] = resp_record
 
-        # store response context
-        responses_list.append(resp)
-        responses_by_index[idx] = resp
-        responses_by_name[step_name] = resp
-        responses_by_name["last"] = resp
+            # verification
+            ok, err = verify_response(resp, step_to_run)
+            step_record["verification"] = {"ok": ok, "error": err}
+            report["steps"].append(step_record)
 
-        # response snapshot (headers + status + body snippet / json typed if possible)
-        resp_record: Dict[str, Any] = {"status_code": resp.status_code, "headers": dict(resp.headers)}
-        try:
-            body_json = _extract_json(resp)
-            resp_record["json"] = body_json
-            # keep a text snippet too
-            resp_record["text_snippet"] = json.dumps(body_json, indent=2)[:2000] if body_json is not None else (resp.text or "")[:2000]
-        except Exception:
-            resp_record["text_snippet"] = (resp.text or "")[:2000]
-        step_record["response"] = resp_record
-
-        # verification
-        ok, err = verify_response(resp, step_to_run)
-        step_record["verification"] = {"ok": ok, "error": err}
-        report["steps"].append(step_record)
-
-        if not ok:
-            # return similar info as run_scenario on failure
-            resp_info = {
-                "status_code": resp.status_code,
-                "body_snippet": resp_record.get("text_snippet")
-            }
-            return False, {"step_index": idx, "step_name": step_name, "error": err, "response": resp_info}, report
+            if not ok:
+                # return similar info as run_scenario on failure
+                resp_info = {
+                    "status_code": resp.status_code,
+                    "body_snippet": resp_record.get("text_snippet")
+                }
+                return False, {"step_index": idx, "step_name": step_name, "error": err, "response": resp_info}, report
 
-    return True, None, report
+        return True, None, report
+    finally:
+        if pool is not None:
+            # requests already in flight finish in the background; queued ones are dropped
+            pool.shutdown(wait=False, cancel_futures=True)
 
 
 def diagnose_ssl_setup():
@@ -810,11 +1293,21 @@ def main_cli():
     parser.add_argument("--report", "-r", help="Write detailed JSON report to this file (optional)", default=None)
     parser.add_argument("--report_json", help="Write detailed JSON report to this file (optional)", default=None)
     parser.add_argument("--report_html", help="Write detailed HTML report to this file (optional)", default=None)
-    parser.add_argument("--verbose", "-v", action="store_true", help="Print per-step report details to console")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print per-step report details to console and keep tracebacks of failed requests in the report")
     parser.add_argument("--test-data", "-t", help="Path to CSV file containing test data", default=None)
+    parser.add_argument("--concurrency", "-j", type=int, default=1,
+                        help="Number of scenarios to run in parallel (steps within a scenario stay sequential)")
+    parser.add_argument("--http2", action="store_true",
+                        help="Send requests over HTTP/2 via httpx (pip install pySystemTest[http2])")
     args = parser.parse_args()
 
+    global _VERBOSE
+    _VERBOSE = args.verbose
+
+    connections = None
     try:
+        # every worker may have a full parallel scenario in flight; keep that many connections alive
+        connections = build_connection_pool(pool_maxsize=max(64, args.concurrency * _MAX_PARALLEL_STEPS), http2=args.http2)
         cfg = load_config(args.config) if args.config else {}
         test_data = load_test_data(args.test_data) if args.test_data else {}
         
@@ -826,8 +1319,15 @@ def main_cli():
         failures = []
         detailed_report = {"scenarios_total": total, "scenarios": []}
 
-        for scen in scenarios:
-            ok, info, scen_report = run_scenario_collect(scen, test_data=test_data)
+        if args.concurrency > 1:
+            # scenarios are independent; map() keeps results in scenario order
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                results = list(pool.map(
+                    lambda sc: run_scenario_collect(sc, test_data=test_data, session=connections.session()), scenarios))
+        else:
+            results = (run_scenario_collect(sc, test_data=test_data, session=connections.session()) for sc in scenarios)
+
+        for scen, (ok, info, scen_report) in zip(scenarios, results):
             detailed_report["scenarios"].append(scen_report)
             if ok:
                 passed += 1
@@ -870,8 +1370,8 @@ def main_cli():
         # Generate detailed reports if requested
         if args.report or args.report_json:
             try:
-                with open(args.report_json, "w", encoding="utf-8") as fh:
-                    json.dump(detailed_report, fh, indent=2, ensure_ascii=False)
+                with open(args.report_json, "wb") as fh:
+                    fh.write(_json_report_bytes(detailed_report))
                 print(f"\nDetailed JSON report written to: {args.report_json}")
             except Exception as e:
                 print(f"Failed to write JSON report: {e}")
@@ -889,6 +1389,9 @@ def main_cli():
     except Exception as exc:
         print(f"Fatal error: {exc}")
         sys.exit(3)
+    finally:
+        if connections is not None:
+            connections.close()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,17 @@
-from jinja2 import Template
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from jinja2 import Environment
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import Markup, escape
 import json
-from typing import Any, Dict
+import multiprocessing
+import os
+from typing import Any, Dict, List
+
+try:
+    import orjson
+except ImportError:  # optional speedup (pip install pySystemTest[speedups])
+    orjson = None
 
 HTML_TMPL = r"""
 <!doctype html>
@@ -29,44 +40,23 @@ HTML_TMPL = r"""
     <div>Scenarios: Passed {{ passed }}  Failed {{ failed }}</div>
   </div>
 
-  {% for s in report.scenarios %}
+  {% for s, sc_failed, steps_html in rows %}
+  {% set sc_id = "sc-" ~ loop.index0 %}
   <div class="scenario">
-    <div class="sc-head" onclick="toggle('sc-{{ loop.index0 }}')">
+    <div class="sc-head" onclick="toggle('{{ sc_id }}')">
       <div>
         <strong>{{ s.name }}</strong>
-        {% if s.source %}<span class="meta">({{ s.source }})</span>{% endif %}
+        {%+ if s.source %}<span class="meta">({{ s.source }})</span>{% endif +%}
       </div>
       <div>
         <span class="badge">steps: {{ s.steps|length }}</span>
-        {% set any_fail = s.steps|selectattr('verification.ok', 'equalto', false)|list|length %}
-        {% if any_fail %}<span class="fail">FAILED</span>{% else %}<span class="ok">PASSED</span>{% endif %}
+        {%+ if sc_failed %}<span class="fail">FAILED</span>{% else %}<span class="ok">PASSED</span>{% endif +%}
       </div>
     </div>
-    <div id="sc-{{ loop.index0 }}" class="sc-body">
-      {% for step in s.steps %}
-      <div class="step">
-        <div><strong>[{{ step.index }}] {{ step.name }}</strong>
-           <span class="meta"> - {{ step.duration_ms }} ms</span>
-           {% if step.verification.ok %}<span class="ok"> OK</span>{% else %}<span class="fail"> FAIL</span>{% endif %}
-        </div>
-        <div class="meta">Request: {{ step.request.method }} {{ step.request.url }}</div>
-        {% if step.request.headers %}
-        <div class="meta">Headers: <pre>{{ step.request.headers|tojson(indent=2) }}</pre></div>
-        {% endif %}
-        {% if step.request.body %}
-        <div class="meta">Body: <pre>{{ step.request.body|tojson(indent=2) }}</pre></div>
-        {% endif %}
-        <div class="meta">Response: status {{ step.response.status_code }}</div>
-        {% if step.response.json is defined %}
-        <div>Response JSON: <pre>{{ step.response.json|tojson(indent=2) }}</pre></div>
-        {% else %}
-        <div>Response Snippet: <pre>{{ step.response.text_snippet }}</pre></div>
-        {% endif %}
-        {% if step.verification.error %}
-        <div style="color:red"><strong>Verification error:</strong> {{ step.verification.error }}</div>
-        {% endif %}
-      </div>
-      {% endfor %}
+    <div id="{{ sc_id }}" class="sc-body">
+      {% if steps_html %}
+      {{ steps_html }}
+      {% endif %}
     </div>
   </div>
   {% endfor %}
@@ -87,6 +77,108 @@ HTML_TMPL = r"""
 </html>
 """
 
+def _tojson_dumps(obj: Any, **kwargs: Any) -> str:
+    """
+    json.dumps stand-in for the template's tojson filter, encoding with orjson.
+    Called with indent plus the environment's json.dumps_kwargs; anything orjson cannot
+    reproduce (other indents or kwargs, ASCII-only output, ints wider than 64 bits)
+    goes to json.dumps.
+    """
+    indent = kwargs.get("indent")
+    if (indent in (None, 2) and set(kwargs) <= {"indent", "sort_keys", "ensure_ascii"}
+            and kwargs.get("ensure_ascii", True) is False):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys"):
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, **kwargs)
+
+
+# autoescape: names, URLs, snippets and errors come from scenarios and servers and may
+# contain markup; trim/lstrip_blocks keep {% %} lines from leaving blank lines behind
+_ENV = Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True, cache_size=-1)
+# keys sorted as tojson does by default; non-ASCII text written as is, which is what orjson
+# produces and lets the json.dumps fallback skip its escaping pass
+_ENV.policies["json.dumps_kwargs"] = {"sort_keys": True, "ensure_ascii": False}
+if orjson is not None:
+    _ENV.policies["json.dumps_function"] = _tojson_dumps
+
+
+def _json_html(obj: Any) -> str:
+    """Same output as the template's |tojson(indent=2), produced outside the template."""
+    return htmlsafe_json_dumps(obj, dumps=_ENV.policies["json.dumps_function"], indent=2,
+                               **_ENV.policies["json.dumps_kwargs"])
+
+
+def _render_step(step: Dict[str, Any]) -> str:
+    """
+    HTML block of one step. Steps are the bulk of a report, so they are formatted here
+    in plain Python instead of through per-node template dispatch; every value from the
+    report is escaped exactly as the autoescaping template would.
+    """
+    request = step.get("request") or {}
+    response = step.get("response") or {}
+    verification = step.get("verification") or {}
+    if verification.get("ok"):
+        badge = '<span class="ok"> OK</span>'
+    else:
+        badge = '<span class="fail"> FAIL</span>'
+    lines = [
+        '      <div class="step">',
+        f'        <div><strong>[{escape(step.get("index", ""))}] {escape(step.get("name", ""))}</strong>',
+        f'           <span class="meta"> - {escape(step.get("duration_ms", ""))} ms</span>',
+        f'           {badge}',
+        '        </div>',
+        f'        <div class="meta">Request: {escape(request.get("method", ""))} {escape(request.get("url", ""))}</div>',
+    ]
+    if request.get("headers"):
+        lines.append(f'        <div class="meta">Headers: <pre>{_json_html(request["headers"])}</pre></div>')
+    if request.get("body"):
+        lines.append(f'        <div class="meta">Body: <pre>{_json_html(request["body"])}</pre></div>')
+    lines.append(f'        <div class="meta">Response: status {escape(response.get("status_code", ""))}</div>')
+    if "json" in response:
+        lines.append(f'        <div>Response JSON: <pre>{_json_html(response["json"])}</pre></div>')
+    else:
+        lines.append(f'        <div>Response Snippet: <pre>{escape(response.get("text_snippet", ""))}</pre></div>')
+    if verification.get("error"):
+        lines.append(f'        <div style="color:red"><strong>Verification error:</strong> {escape(verification["error"])}</div>')
+    lines.append('      </div>')
+    return "\n".join(lines)
+
+
+def _render_steps(steps: List[Dict[str, Any]]) -> str:
+    """HTML of all steps of one scenario (module level so worker processes can run it)."""
+    return "\n".join(_render_step(st) for st in steps).lstrip()
+
+
+# reports with at least this many steps render their scenarios in worker processes;
+# below it, shipping the steps to the workers costs more than it saves
+_PARALLEL_MIN_STEPS = 50000
+
+
+def _render_all_steps(step_lists: List[List[Dict[str, Any]]]) -> List[str]:
+    """_render_steps for every scenario, in order; spread over CPU cores for big reports."""
+    workers = min(os.cpu_count() or 1, len(step_lists))
+    if workers > 1 and sum(len(steps) for steps in step_lists) >= _PARALLEL_MIN_STEPS:
+        try:
+            # spawn, not fork: the runner's threads and open sessions must not be copied into workers
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                return list(pool.map(_render_steps, step_lists, chunksize=max(1, len(step_lists) // (workers * 4))))
+        except (OSError, BrokenProcessPool):
+            # workers could not be started or died; render in this process instead
+            pass
+    return [_render_steps(steps) for steps in step_lists]
+
+
+# compiled once per process; from_string() tokenizes and compiles the source to Python code
+_TMPL = _ENV.from_string(HTML_TMPL)
+
+
 def generate_html_report(report: Dict[str, Any], out_path: str):
     """
     report: the detailed_report structure produced by the runner:
@@ -96,17 +188,20 @@ def generate_html_report(report: Dict[str, Any], out_path: str):
       }
     out_path: path to write HTML file
     """
-    # compute summary counts
-    passed = 0
-    failed = 0
-    for s in report.get("scenarios", []):
-        any_fail = any((not st.get("verification", {}).get("ok", True)) for st in s.get("steps", []))
-        if any_fail:
-            failed += 1
-        else:
-            passed += 1
-
-    tmpl = Template(HTML_TMPL)
-    html = tmpl.render(report=report, passed=passed, failed=failed)
-    with open(out_path, "w", encoding="utf-8") as fh:
-        fh.write(html)
\ No newline at end of file
+    # compute summary counts; the per-scenario flags and rendered steps go to the template
+    # next to each scenario, the report itself is left untouched
+    scenarios = report.get("scenarios", [])
+    failed_flags = [
+        any((not (st.get("verification") or {}).get("ok", True)) for st in s.get("steps", []))
+        for s in scenarios
+    ]
+    failed = sum(failed_flags)
+    passed = len(scenarios) - failed
+    steps_html = [Markup(h) for h in _render_all_steps([s.get("steps", []) for s in scenarios])]
+
+    # write the page as it is rendered instead of building the whole document first
+    stream = _TMPL.stream(report=report, rows=zip(scenarios, failed_flags, steps_html), passed=passed, failed=failed)
+    stream.enable_buffering(size=64)
+    # 1 MiB buffer: a large report reaches the kernel in few big writes; dump() encodes itself
+    with open(out_path, "wb", buffering=1 << 20) as fh:
+        stream.dump(fh, encoding="utf-8")
\ No newline at end of file
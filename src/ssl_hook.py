@@ -1,31 +1,36 @@
 import os
 import sys
-import ssl
-import certifi
-import requests.certs
+
+def _find_cert_bundle(bundle_dir):
+    """Return the first readable CA bundle, preferring the copies shipped with the executable."""
+    cert_locations = [
+        os.path.join(bundle_dir, 'cacert.pem'),
+        os.path.join(bundle_dir, 'config', 'cacert.pem'),
+        os.path.join(os.path.dirname(bundle_dir), 'config', 'cacert.pem'),
+    ]
+    for cert_path in cert_locations:
+        if os.path.isfile(cert_path) and os.access(cert_path, os.R_OK):
+            return cert_path
+
+    # certifi / requests (urllib3, charset_normalizer, ...) are only imported when no
+    # bundled copy was found
+    import certifi
+    import requests.certs
+    for cert_path in (certifi.where(), requests.certs.where()):
+        if os.path.isfile(cert_path) and os.access(cert_path, os.R_OK):
+            return cert_path
+    return None
 
 def configure_ssl():
     """Configure SSL certificate paths for frozen executable."""
     if getattr(sys, 'frozen', False):
         # Running as compiled executable
         bundle_dir = getattr(sys, '_MEIPASS', os.path.dirname(sys.executable))
-        
-        # Check certificate locations in order of preference
-        cert_locations = [
-            os.path.join(bundle_dir, 'cacert.pem'),
-            os.path.join(bundle_dir, 'config', 'cacert.pem'),
-            os.path.join(os.path.dirname(bundle_dir), 'config', 'cacert.pem'),
-            certifi.where(),
-            requests.certs.where()
-        ]
-        
-        # Use first valid certificate file found
-        for cert_path in cert_locations:
-            if os.path.isfile(cert_path) and os.access(cert_path, os.R_OK):
-                os.environ['SSL_CERT_FILE'] = cert_path
-                os.environ['REQUESTS_CA_BUNDLE'] = cert_path
-                ssl._create_default_https_context = ssl._create_unverified_context
-                break
+        cert_path = _find_cert_bundle(bundle_dir)
+        if cert_path:
+            # ssl.create_default_context() honours SSL_CERT_FILE, requests REQUESTS_CA_BUNDLE
+            os.environ['SSL_CERT_FILE'] = cert_path
+            os.environ['REQUESTS_CA_BUNDLE'] = cert_path
 
 # Execute hook when module is imported
-configure_ssl()
\ No newline at end of file
+configure_ssl()
@@ -2,18 +2,118 @@
 Small utility helpers used by tests and the runner.
 """
 
-from typing import Any, Dict, Tuple, Optional
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple, Optional, TYPE_CHECKING
+import copy
+import functools
 import json
-import yaml
-from jsonpath_ng import parse as jsonpath_parse
-import requests
+import os
+import re
+
+# yaml, jsonpath_ng (PLY) and requests are imported by the helpers that use them, so
+# importing this module stays cheap
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # optional speedup (pip install pySystemTest[speedups])
+    orjson = None
+
+# absolute path -> ((mtime_ns, size), parsed document) of files read by load_yaml_file
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
 
 
 def load_yaml_file(path: str) -> Dict[str, Any]:
-    """Load YAML file and return parsed dict (raises on error)."""
-    with open(path, "rt", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
-    return data or {}
+    """
+    Load YAML file and return parsed dict (raises on error).
+    A file is parsed again only when its mtime or size changed; callers always get their
+    own (deep) copy of the cached document.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = os.path.abspath(path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
+
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it, pure-Python SafeLoader otherwise
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # raw bytes go straight to the loader, which detects the encoding itself
+    with open(path, "rb") as fh:
+        data = yaml.load(fh, Loader=loader) or {}
+    _YAML_CACHE[key] = (stamp, data)
+    return copy.deepcopy(data)
+
+
+# JSONPaths built only from '.field' and '[index]' steps are walked without jsonpath_ng
+_SIMPLE_JSONPATH_RE = re.compile(r"\$(?:\.[A-Za-z_][A-Za-z0-9_]*|\[[0-9]+\])+", re.ASCII)
+_SIMPLE_JSONPATH_STEP_RE = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[([0-9]+)\]", re.ASCII)
+
+
+class Found:
+    """Match of a SimplePath; mirrors the .value attribute of jsonpath_ng's datums."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+class SimplePath:
+    """
+    Plain dict/list walk for paths made only of '.field' and '[index]' steps, e.g.
+    $.data.items[0].id. find() returns the same matches jsonpath_ng would (zero or one)
+    without building its expression tree or context objects.
+    """
+
+    __slots__ = ("ops",)
+
+    def __init__(self, ops: Tuple[Any, ...]):
+        # str -> dict key, int -> list index
+        self.ops = ops
+
+    def find(self, data: Any) -> List[Found]:
+        cur = data
+        for op in self.ops:
+            if type(op) is str:
+                if not isinstance(cur, dict) or op not in cur:
+                    return []
+            elif not isinstance(cur, (list, str)) or op >= len(cur):
+                # jsonpath_ng indexes strings as well
+                return []
+            cur = cur[op]
+        return [Found(cur)]
+
+
+def simple_path(path: str) -> Optional[SimplePath]:
+    """Return a SimplePath for a '.field' / '[index]' only path, None for anything else."""
+    if not _SIMPLE_JSONPATH_RE.fullmatch(path):
+        return None
+    ops = []
+    for field, index in _SIMPLE_JSONPATH_STEP_RE.findall(path):
+        if field in ("where", "wherenot"):
+            # jsonpath_ng keywords; leave them to the real parser
+            return None
+        ops.append(field if field else int(index))
+    return SimplePath(tuple(ops))
+
+
+@functools.lru_cache(maxsize=512)
+def compile_path(path: str):
+    """
+    Compile a JSONPath once: a SimplePath for '.field' / '[index]' only paths, a jsonpath_ng
+    expression otherwise. Both expose find(body). Raises on invalid paths (not cached).
+    """
+    simple = simple_path(path)
+    if simple is not None:
+        return simple
+    from jsonpath_ng import parse as jsonpath_parse
+
+    return jsonpath_parse(path)
 
 
 def compare_jsonpath(body: Any, path: str, expected: Any) -> Tuple[bool, Optional[str]]:
@@ -22,27 +122,41 @@ def compare_jsonpath(body: Any, path: str, expected: Any) -> Tuple[bool, Optiona
     Returns (True, None) when any match equals expected, otherwise (False, message).
     """
     try:
-        expr = jsonpath_parse(path)
+        expr = compile_path(path)
     except Exception as exc:
         return False, f"Invalid JSONPath '{path}': {exc}"
-    matches = [m.value for m in expr.find(body)]
-    if not matches:
+    found = expr.find(body)
+    if not found:
         return False, f"JSON path '{path}' not found"
-    for mv in matches:
-        if mv == expected:
-            return True, None
-    return False, f"JSON path '{path}' expected {expected!r} but got {matches!r}"
+    # stop at the first equal value; the value list is only built for the failure message
+    if expected in (m.value for m in found):
+        return True, None
+    return False, f"JSON path '{path}' expected {expected!r} but got {[m.value for m in found]!r}"
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """UTF-8 JSON for obj, encoded by orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles them
+            pass
+    return json.dumps(obj).encode("utf-8")
 
 
 def make_response_json(obj: Any, status: int = 200, headers: Dict[str, str] = None) -> requests.Response:
     """
     Convenience for building a requests.Response with JSON body for tests.
     """
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
     resp = requests.Response()
     resp.status_code = status
-    body = json.dumps(obj)
-    resp._content = body.encode("utf-8")
-    hdrs = dict(headers or {})
+    resp._content = _json_bytes(obj)
+    resp._content_consumed = True
+    hdrs = CaseInsensitiveDict(headers or {})
     hdrs.setdefault("Content-Type", "application/json")
     resp.headers = hdrs
     resp.encoding = "utf-8"
@@ -1,8 +1,8 @@
 import json
 import os
 import pytest
-from src import load_scenarios, verify_response, run_scenario, execute_api_call
-from src import utils
+from src.api_tester import load_scenarios, verify_response, run_scenario, execute_api_call
+from src import utils, api_tester
 
 
 def test_load_scenarios_valid(tmp_path):
@@ -101,4 +101,287 @@ def test_execute_api_call_live(monkeypatch):
     assert captured['method'] == "POST"
     assert captured['url'] == "http://test.local/api"
     assert "json" in captured['kwargs'] and captured['kwargs']['json'] == {"a": 1}
-    assert resp.status_code == 200
\ No newline at end of file
+    assert resp.status_code == 200
+
+
+def test_load_scenarios_reuses_json_cache(tmp_path):
+    p = tmp_path / "scenarios.yaml"
+    p.write_text("scenarios:\n  - name: S1\n    steps: []\n", encoding="utf-8")
+    first = load_scenarios(str(p))
+    cache = tmp_path / "scenarios.yaml.cache.json"
+    assert cache.exists()
+    assert load_scenarios(str(p)) == first
+
+    # editing the YAML invalidates the cache
+    p.write_text("scenarios:\n  - name: S2-edited\n    steps: []\n", encoding="utf-8")
+    assert load_scenarios(str(p))["scenarios"][0]["name"] == "S2-edited"
+
+
+def test_load_scenarios_aggregate_matches_extensions_in_any_case(tmp_path):
+    root = tmp_path / "suite"
+    (root / "nested").mkdir(parents=True)
+    for rel, name in [("a.yml", "A"), ("nested/B.YAML", "B"), ("C.Yml", "C"), ("notes.txt", "X")]:
+        (root / rel).write_text(f"scenarios:\n  - name: {name}\n    steps: []\n", encoding="utf-8")
+    linked = tmp_path / "linked"
+    linked.mkdir()
+    (linked / "d.yaml").write_text("scenarios:\n  - name: D\n    steps: []\n", encoding="utf-8")
+    try:
+        (root / "link").symlink_to(linked, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported here")
+
+    data = api_tester.load_scenarios_aggregate(str(root))
+    assert sorted(s["name"] for s in data["scenarios"]) == ["A", "B", "C", "D"]
+
+
+def test_run_scenario_streams_status_only_steps(monkeypatch):
+    seen = []
+
+    def fake_execute(step, session=None):
+        seen.append(step.get("_stream", False))
+        return utils.make_response_json({"data": {"id": 1}}, status=200)
+
+    monkeypatch.setattr("src.api_tester.execute_api_call", fake_execute)
+
+    scenario = {
+        "name": "stream-status-only",
+        "steps": [
+            {"name": "probe", "action": {"method": "GET", "url": "http://example/1"}, "verification": {"status_code": 200}},
+            {"name": "check", "action": {"method": "GET", "url": "http://example/2"},
+             "verification": {"status_code": 200, "json_assertions": [{"path": "$.data.id", "expected_value": 1}]}}
+        ]
+    }
+
+    ok, info = run_scenario(scenario)
+    assert ok is True
+    assert seen == [True, False]
+
+
+def test_run_scenario_collect_parallel_reports_in_step_order(monkeypatch):
+    def fake_execute(step, session=None):
+        n = int(step["action"]["url"].rsplit("/", 1)[1])
+        return utils.make_response_json({"n": n}, status=200 if n != 2 else 500)
+
+    monkeypatch.setattr("src.api_tester.execute_api_call", fake_execute)
+
+    scenario = {
+        "name": "parallel-steps",
+        "parallel": True,
+        "steps": [
+            {"name": f"s{n}", "action": {"method": "GET", "url": f"http://example/{n}"}, "verification": {"status_code": 200}}
+            for n in (1, 2, 3)
+        ]
+    }
+
+    ok, info, report = api_tester.run_scenario_collect(scenario)
+    assert ok is False
+    assert info["step_index"] == 2
+    assert [st["index"] for st in report["steps"]] == [1, 2]
+    assert report["steps"][0]["response"]["json"] == {"n": 1}
+
+
+def test_run_scenario_does_not_modify_scenario_steps(monkeypatch):
+    responses = [utils.make_response_json({"data": {"id": 7}}, status=200),
+                 utils.make_response_json({"ok": True}, status=200)]
+    sent = []
+
+    def fake_execute(step, session=None):
+        sent.append(step["action"]["url"])
+        return responses.pop(0)
+
+    monkeypatch.setattr("src.api_tester.execute_api_call", fake_execute)
+
+    scenario = {
+        "name": "placeholders",
+        "steps": [
+            {"name": "create", "action": {"method": "POST", "url": "http://example/items"}, "verification": {"status_code": 200}},
+            {"name": "fetch", "action": {"method": "GET", "url": "http://example/items/$resp[create].jsonpath($.data.id)"},
+             "verification": {"status_code": 200}}
+        ]
+    }
+
+    ok, info = run_scenario(scenario)
+    assert ok is True
+    assert sent == ["http://example/items", "http://example/items/7"]
+    assert scenario["steps"][1]["action"]["url"] == "http://example/items/$resp[create].jsonpath($.data.id)"
+
+
+def test_simple_jsonpaths_match_jsonpath_ng():
+    from jsonpath_ng import parse
+
+    body = {"data": {"items": [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": []}], "name": "abc", "none": None}}
+    for path in ["$.data.items[0].id", "$.data.items[1].tags[0]", "$.data.items[5].id", "$.data.missing",
+                 "$.data.name[1]", "$.data.none"]:
+        expr = api_tester._compiled_path(path)
+        assert isinstance(expr, utils.SimplePath)
+        assert [m.value for m in expr.find(body)] == [m.value for m in parse(path).find(body)]
+    # anything beyond '.field' / '[index]' still goes through jsonpath_ng
+    assert not isinstance(api_tester._compiled_path("$.data.items[*].id"), utils.SimplePath)
+
+
+def test_compare_jsonpath_compiled_and_fallback_paths():
+    body = {"data": {"items": [{"id": 1}, {"id": 2}]}}
+    assert utils.compile_path("$.data.items[1].id").ops == ("data", "items", 1, "id")
+    assert utils.compare_jsonpath(body, "$.data.items[1].id", 2) == (True, None)
+    assert utils.compare_jsonpath(body, "$.data.items[5].id", 2)[0] is False
+    assert utils.compare_jsonpath(body, "$.data.items[*].id", 2) == (True, None)
+    ok, msg = utils.compare_jsonpath(body, "$.data.items[*].id", 3)
+    assert ok is False and "[1, 2]" in msg
+
+
+def test_build_session_returns_429_with_retry_after():
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        session = api_tester.build_session()
+        resp = session.get(f"http://127.0.0.1:{server.server_port}/limited", timeout=5)
+        assert resp.status_code == 429
+        assert hits == ["/limited"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_test_data_substitutes_assertion_paths(monkeypatch):
+    monkeypatch.setattr("src.api_tester.execute_api_call",
+                        lambda step, session=None: utils.make_response_json({"data": {"id": 5}}))
+    data = api_tester._compile_scenarios({"scenarios": [{
+        "name": "S",
+        "steps": [{"name": "get", "action": {"url": "http://example/x"},
+                   "verification": {"json_assertions": [{"path": "$.data['$key']", "expected_value": 5}]}}],
+    }]})
+    ok, info = run_scenario(data["scenarios"][0], test_data={"S": {"key": "id"}})
+    assert ok is True, info
+
+
+def test_run_scenario_status_only_steps_reuse_one_connection():
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    connections = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            connections.append(self.client_address)
+            super().setup()
+
+        def do_GET(self):
+            body = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    session = api_tester.build_session()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/ping"
+        scenario = {"name": "keepalive", "steps": [
+            {"name": f"s{i}", "action": {"url": url}, "verification": {"status_code": 200}} for i in range(5)
+        ]}
+        ok, info = run_scenario(scenario, session=session)
+        assert ok is True, info
+        assert len(connections) == 1
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_scenarios_share_connections_but_not_cookies(http2):
+    if http2:
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    connections = []
+    cookies = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            connections.append(self.client_address)
+            super().setup()
+
+        def do_GET(self):
+            cookies[self.path] = self.headers.get("Cookie")
+            self.send_response(200)
+            if self.path == "/login":
+                self.send_header("Set-Cookie", "sid=abc; Path=/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    pool = api_tester.build_connection_pool(http2=http2)
+    try:
+        base = f"http://127.0.0.1:{server.server_port}"
+        login = {"name": "A", "steps": [
+            {"name": "login", "action": {"url": f"{base}/login"}, "verification": {"status_code": 200}},
+            {"name": "me", "action": {"url": f"{base}/me"}, "verification": {"status_code": 200}},
+        ]}
+        anonymous = {"name": "B", "steps": [
+            {"name": "private", "action": {"url": f"{base}/private"}, "verification": {"status_code": 200}},
+        ]}
+        assert run_scenario(login, session=pool.session())[0] is True
+        assert run_scenario(anonymous, session=pool.session())[0] is True
+        assert cookies["/me"] == "sid=abc"
+        assert cookies["/private"] is None
+        assert len(connections) == 1
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_generate_html_report_leaves_report_unchanged(tmp_path):
+    from src.reporting import generate_html_report
+
+    report = {"scenarios_total": 2, "scenarios": [
+        {"name": "a", "source": "a.yaml", "steps": [
+            {"index": 1, "name": "s1", "duration_ms": 5, "request": {"method": "GET", "url": "http://x"},
+             "response": {"status_code": 500}, "verification": {"ok": False, "error": "boom"}}]},
+        # a step whose request raised is recorded without response or verification
+        {"name": "b", "source": "b.yaml", "steps": [
+            {"index": 1, "name": "s1", "duration_ms": 3, "request": {"method": "GET", "url": "http://down"},
+             "response": None, "verification": None, "error": "ConnectionError"}]}]}
+    before = json.dumps(report, sort_keys=True)
+
+    out = tmp_path / "report.html"
+    generate_html_report(report, str(out))
+
+    assert json.dumps(report, sort_keys=True) == before
+    html = out.read_text(encoding="utf-8")
+    assert "FAILED" in html and "boom" in html